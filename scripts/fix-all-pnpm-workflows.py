@@ -5,32 +5,43 @@ Script to fix all pnpm workflow issues:
 2. Change version: 9 to version: 10 (when used with pnpm action)
 """
 
+import io
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'utils'))
+from workflow_files import list_workflow_files  # noqa: E402
+
+WORKFLOWS_DIR = Path('.github/workflows')
+
+# Look for pnpm action setup followed by version: 9
+_PAT_V9 = re.compile(rb'(pnpm/action-setup@v\d+\s+with:\s+version:)\s*9')
+
 def fix_workflow_file(file_path):
     """Fix pnpm configuration in a workflow file"""
-    content = file_path.read_text()
+    content = file_path.read_bytes()
+
+    # Both fixes only apply to files using the pnpm action
+    if b'pnpm/action-setup@' not in content:
+        return False, []
+
     original_content = content
     changes = []
 
     # Fix 1: Change @v4 to @v2
-    pattern1 = r'pnpm/action-setup@v4'
-    if re.search(pattern1, content):
-        content = re.sub(pattern1, 'pnpm/action-setup@v2', content)
-        count = len(re.findall(pattern1, original_content))
+    count = content.count(b'pnpm/action-setup@v4')
+    if count:
+        content = content.replace(b'pnpm/action-setup@v4', b'pnpm/action-setup@v2')
         changes.append(f"Updated action version v4 → v2 ({count} occurrences)")
 
     # Fix 2: Change version: 9 to version: 10 (in pnpm action context)
-    # Look for pnpm action setup followed by version: 9
-    pattern2 = r'(pnpm/action-setup@v\d+\s+with:\s+version:)\s*9'
-    if re.search(pattern2, content):
-        content = re.sub(pattern2, r'\1 10', content)
-        count = len(re.findall(pattern2, original_content))
+    content, count = _PAT_V9.subn(rb'\1 10', content)
+    if count:
         changes.append(f"Updated pnpm version 9 → 10 ({count} occurrences)")
 
     if content != original_content:
-        file_path.write_text(content)
+        file_path.write_bytes(content)
         return True, changes
     else:
         return False, []
@@ -38,21 +49,23 @@ def fix_workflow_file(file_path):
 def main():
     print("🔧 Fixing pnpm configuration in all workflow files...\n")
 
-    workflows_dir = Path('.github/workflows')
-    workflow_files = list(workflows_dir.glob('*.yml'))
+    workflow_files = sorted(list_workflow_files(WORKFLOWS_DIR))
 
     print(f"Found {len(workflow_files)} workflow files\n")
 
     modified = []
-    for file in sorted(workflow_files):
+    out = io.StringIO()
+    for file in workflow_files:
         success, changes = fix_workflow_file(file)
         if success:
-            print(f"✓ {file.name}")
+            print(f"✓ {file.name}", file=out)
             for change in changes:
-                print(f"  - {change}")
+                print(f"  - {change}", file=out)
             modified.append(file.name)
         else:
-            print(f"• {file.name} - no changes needed")
+            print(f"• {file.name} - no changes needed", file=out)
+
+    sys.stdout.write(out.getvalue())
 
     print(f"\n{'='*80}")
     print(f"✅ Processed {len(workflow_files)} workflow files")
@@ -3,47 +3,60 @@
 Script to add pnpm/action-setup@v2 step before setup-node@v4 in all workflows
 """
 
-import os
+import io
+import mmap
 import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'utils'))
+from workflow_files import list_workflow_files  # noqa: E402
+
+WORKFLOWS_DIR = Path('.github/workflows')
+
 PNPM_SETUP = """      - name: 📦 Setup pnpm
         uses: pnpm/action-setup@v2
         with:
           version: 8
 
-"""
+""".encode()
+
+# Match lines like "      - name: 🔧 Setup Node.js" followed by "        uses: actions/setup-node@v4"
+_PAT_SETUP_NODE = re.compile(rb'([ ]{6}- name: [^\n]+Setup Node[^\n]*\n[ ]{8}uses: actions/setup-node@v4)')
+# Replacement template: pnpm setup followed by the matched setup-node step
+_PNPM_SETUP_TEMPLATE = PNPM_SETUP + rb'\1'
 
-def find_workflow_files():
-    """Find all workflow files that use pnpm cache"""
-    workflows_dir = Path('.github/workflows')
+def find_workflow_files(workflow_files):
+    """Find the workflow files that use pnpm cache"""
     files = []
-    for file in workflows_dir.glob('*.yml'):
-        content = file.read_text()
-        if "cache: 'pnpm'" in content:
-            files.append(file)
+    for file in workflow_files:
+        # Search the mapped file directly instead of reading it into memory
+        with open(file, 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if mm.find(b"cache: 'pnpm'") != -1:
+                        files.append(file)
+            except ValueError:
+                # Empty files cannot be mapped
+                continue
     return files
 
 def fix_workflow_file(file_path):
     """Add pnpm setup before setup-node in a workflow file"""
-    content = file_path.read_text()
+    content = file_path.read_bytes()
 
     # Check if already has pnpm setup
-    if 'pnpm/action-setup' in content:
+    if b'pnpm/action-setup' in content:
         return False, "Already has pnpm setup"
 
-    # Pattern to find setup-node step
-    # Match lines like "      - name: 🔧 Setup Node.js" followed by "        uses: actions/setup-node@v4"
-    pattern = r'([ ]{6}- name: [^\n]+Setup Node[^\n]*\n[ ]{8}uses: actions/setup-node@v4)'
+    if b'actions/setup-node@v4' not in content:
+        return False, "No setup-node found"
 
     # Replace with pnpm setup followed by setup-node
-    def replacement(match):
-        return PNPM_SETUP + match.group(1)
-
-    new_content, count = re.subn(pattern, replacement, content)
+    new_content, count = _PAT_SETUP_NODE.subn(_PNPM_SETUP_TEMPLATE, content)
 
     if count > 0:
-        file_path.write_text(new_content)
+        file_path.write_bytes(new_content)
         return True, f"Added pnpm setup ({count} locations)"
     else:
         return False, "No setup-node found"
@@ -51,17 +64,20 @@ def fix_workflow_file(file_path):
 def main():
     print("🔧 Fixing pnpm setup in workflow files...\n")
 
-    workflow_files = find_workflow_files()
+    workflow_files = find_workflow_files(list_workflow_files(WORKFLOWS_DIR))
     print(f"Found {len(workflow_files)} workflow files using pnpm\n")
 
     modified = []
+    out = io.StringIO()
     for file in workflow_files:
-        print(f"Processing: {file.name}")
+        print(f"Processing: {file.name}", file=out)
         success, message = fix_workflow_file(file)
-        print(f"  {'✓' if success else '•'} {message}")
+        print(f"  {'✓' if success else '•'} {message}", file=out)
         if success:
             modified.append(file.name)
 
+    sys.stdout.write(out.getvalue())
+
     print(f"\n✅ Processed {len(workflow_files)} workflow files")
     print(f"Modified {len(modified)} files:\n")
     for name in modified:
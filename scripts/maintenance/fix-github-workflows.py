@@ -8,101 +8,113 @@ This script:
 3. Adds pnpm setup step before Node.js setup if missing
 """
 
+import io
 import os
 import re
+import shutil
 import sys
 from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'utils'))
+from workflow_files import list_workflow_files  # noqa: E402
 
 WORKFLOWS_DIR = Path('.github/workflows')
-PNPM_SETUP = """      - name: Install pnpm
+PNPM_SETUP = b"""      - name: Install pnpm
         uses: pnpm/action-setup@v4
         with:
           version: 9
 
 """
 
+# First setup-node action, used as the insertion point for the pnpm step
+_PAT_NODE_SETUP = re.compile(rb'(\s+- name: Setup Node\.js[^\n]*\n\s+uses: actions/setup-node@)')
+
 
-def has_pnpm_setup(content: str) -> bool:
+def has_pnpm_setup(content: bytes) -> bool:
     """Check if workflow already has pnpm setup step."""
-    return 'pnpm/action-setup' in content
+    return b'pnpm/action-setup' in content
 
 
-def needs_pnpm_setup(content: str) -> bool:
+def needs_pnpm_setup(content: bytes) -> bool:
     """Check if workflow needs pnpm (uses npm commands)."""
-    return ("cache: 'npm'" in content or
-            'run: npm ci' in content or
-            'run: npm install' in content)
+    return (b"cache: 'npm'" in content or
+            b'run: npm ci' in content or
+            b'run: npm install' in content)
 
 
-def add_pnpm_setup(content: str) -> str:
-    """Add pnpm setup step before first Node.js setup."""
-    # Find the first setup-node action
-    pattern = r'(\s+- name: Setup Node\.js[^\n]*\n\s+uses: actions/setup-node@)'
+def replace_run_command(content: bytes, old: bytes, new: bytes) -> bytes:
+    """Replace a `run:` command that ends its line (or the file)."""
+    content = content.replace(b'run: ' + old + b'\n', b'run: ' + new + b'\n')
+    if content.endswith(b'run: ' + old):
+        content = content[:-len(old)] + new
+    return content
+
 
-    match = re.search(pattern, content)
+def add_pnpm_setup(content: bytes) -> Optional[bytes]:
+    """Add pnpm setup step before first Node.js setup. Returns None if not found."""
+    # Find the first setup-node action
+    match = _PAT_NODE_SETUP.search(content)
     if not match:
-        print("   ⚠️  Could not find 'Setup Node.js' step to insert pnpm setup")
-        return content
+        return None
 
     # Insert pnpm setup before Node.js setup
     pos = match.start()
     return content[:pos] + PNPM_SETUP + content[pos:]
 
 
-def fix_workflow(file_path: Path) -> bool:
-    """Fix a single workflow file. Returns True if modified."""
-    with open(file_path, 'r') as f:
-        original_content = f.read()
-
-    content = original_content
-    modified = False
+def fix_workflow(file_path: Path) -> tuple[bool, list[str]]:
+    """Fix a single workflow file. Returns (modified, warnings)."""
+    original_content = file_path.read_bytes()
 
     # Check if workflow needs fixing
-    if not needs_pnpm_setup(content):
-        return False
+    if not needs_pnpm_setup(original_content):
+        return False, []
+
+    warnings = []
 
     # 1. Replace cache: 'npm' with cache: 'pnpm'
-    if "cache: 'npm'" in content:
-        content = content.replace("cache: 'npm'", "cache: 'pnpm'")
-        modified = True
+    content = original_content.replace(b"cache: 'npm'", b"cache: 'pnpm'")
 
     # 2. Replace npm ci with pnpm install --frozen-lockfile
-    if 'run: npm ci' in content:
-        content = re.sub(
-            r'run: npm ci$',
-            'run: pnpm install --frozen-lockfile',
-            content,
-            flags=re.MULTILINE
-        )
-        modified = True
+    content = replace_run_command(content, b'npm ci', b'pnpm install --frozen-lockfile')
 
     # 3. Replace npm install with pnpm install (but not global installs)
     # Only replace bare "npm install" not "npm install -g"
-    if re.search(r'run: npm install$', content, re.MULTILINE):
-        content = re.sub(
-            r'run: npm install$',
-            'run: pnpm install',
-            content,
-            flags=re.MULTILINE
-        )
-        modified = True
+    content = replace_run_command(content, b'npm install', b'pnpm install')
 
     # 4. Add pnpm setup step if not present
     if not has_pnpm_setup(content):
-        content = add_pnpm_setup(content)
-        modified = True
-
-    # Write back if modified
-    if modified:
-        # Create backup
-        backup_path = file_path.with_suffix(file_path.suffix + '.bak')
-        with open(backup_path, 'w') as f:
-            f.write(original_content)
-
-        with open(file_path, 'w') as f:
-            f.write(content)
-
-    return modified
+        updated = add_pnpm_setup(content)
+        if updated is None:
+            warnings.append("Could not find 'Setup Node.js' step to insert pnpm setup")
+        else:
+            content = updated
+
+    # Only back up and write when a transformation actually changed the file
+    if content == original_content:
+        return False, warnings
+
+    # Create backup as a hardlink to the original file, falling back to a copy
+    # where hardlinks are not supported
+    backup_path = file_path.with_suffix(file_path.suffix + '.bak')
+    backup_path.unlink(missing_ok=True)
+    try:
+        os.link(file_path, backup_path)
+    except OSError:
+        shutil.copyfile(file_path, backup_path)
+
+    # Write to a temp file and swap it in, so the backup keeps the original inode
+    tmp_path = file_path.with_suffix(file_path.suffix + '.tmp')
+    try:
+        tmp_path.write_bytes(content)
+        shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    return True, warnings
 
 
 def main():
@@ -112,21 +124,28 @@ def main():
         print(f"❌ Error: {WORKFLOWS_DIR} not found")
         sys.exit(1)
 
-    workflow_files = sorted(WORKFLOWS_DIR.glob('*.yml'))
+    workflow_files = sorted(list_workflow_files(WORKFLOWS_DIR))
     fixed_count = 0
     skipped_count = 0
 
+    out = io.StringIO()
     for file_path in workflow_files:
         filename = file_path.name
-        print(f"Processing: {filename}")
+        print(f"Processing: {filename}", file=out)
+
+        fixed, warnings = fix_workflow(file_path)
+        for warning in warnings:
+            print(f"   ⚠️  {warning}", file=out)
 
-        if fix_workflow(file_path):
-            print(f"   ✅ Fixed\n")
+        if fixed:
+            print(f"   ✅ Fixed\n", file=out)
             fixed_count += 1
         else:
-            print(f"   ⏭️  Skipped (already uses pnpm or no npm commands)\n")
+            print(f"   ⏭️  Skipped (already uses pnpm or no npm commands)\n", file=out)
             skipped_count += 1
 
+    sys.stdout.write(out.getvalue())
+
     print("━" * 70)
     print(f"✅ Fixed: {fixed_count} workflows")
     print(f"⏭️  Skipped: {skipped_count} workflows")
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+"""
+Fix GitHub Actions workflows for pnpm in a single pass.
+
+Applies the fixes from fix-github-workflows.py, fix-pnpm-workflows.py,
+fix-all-pnpm-workflows.py and update-pnpm-version.py with one read and
+at most one write per workflow file:
+1. Replaces cache: 'npm' with cache: 'pnpm'
+2. Replaces 'npm ci' / 'npm install' with their pnpm equivalents
+3. Adds a pnpm setup step before each Node.js setup if missing
+4. Updates existing pnpm/action-setup steps from @v4 to @v2 and pnpm 8/9 to 10
+
+Fixes are applied as text edits rather than a YAML load/dump round trip
+so that untouched lines, comments and quoting stay byte-for-byte intact
+and the script needs nothing beyond the standard library.
+"""
+
+import io
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'utils'))
+from workflow_files import list_workflow_files  # noqa: E402
+
+WORKFLOWS_DIR = Path('.github/workflows')
+PNPM_VERSION = b'10'
+
+# Setup Node step, capturing its indentation so the pnpm step can match it
+_PAT_SETUP_NODE = re.compile(
+    rb'^( *)(- name: [^\n]*Setup Node[^\n]*\n *uses: actions/setup-node@)',
+    re.MULTILINE
+)
+_PNPM_SETUP = ('\\1- name: 📦 Setup pnpm\n'
+               '\\1  uses: pnpm/action-setup@v2\n'
+               '\\1  with:\n'
+               '\\1    version: ').encode() + PNPM_VERSION + b'\n\n\\1\\2'
+# pnpm 9 is bumped on any action version, pnpm 8 only on @v2 (as the single scripts do)
+_PAT_PNPM_V9 = re.compile(rb'(pnpm/action-setup@v\d+\s+with:\s+version:)\s*9\b')
+_PAT_PNPM_V8 = re.compile(rb'(pnpm/action-setup@v2\s+with:\s+version:)\s*8\b')
+
+
+def replace_run_command(content: bytes, old: bytes, new: bytes) -> bytes:
+    """Replace a `run:` command that ends its line (or the file)."""
+    content = content.replace(b'run: ' + old + b'\n', b'run: ' + new + b'\n')
+    if content.endswith(b'run: ' + old):
+        content = content[:-len(old)] + new
+    return content
+
+
+def fix_workflow_file(file_path: Path) -> tuple[bool, list[str]]:
+    """Apply every pnpm fix to a workflow file. Returns (modified, changes)."""
+    original_content = file_path.read_bytes()
+
+    if b'npm' not in original_content:
+        return False, []
+
+    content = original_content
+    changes = []
+
+    # 1. Replace cache: 'npm' with cache: 'pnpm'
+    count = content.count(b"cache: 'npm'")
+    if count:
+        content = content.replace(b"cache: 'npm'", b"cache: 'pnpm'")
+        changes.append(f"Switched npm cache to pnpm ({count} occurrences)")
+
+    # 2. Replace npm ci / bare npm install (but not global installs)
+    updated = replace_run_command(content, b'npm ci', b'pnpm install --frozen-lockfile')
+    updated = replace_run_command(updated, b'npm install', b'pnpm install')
+    if updated != content:
+        content = updated
+        changes.append("Replaced npm install commands with pnpm")
+
+    # 3. Add pnpm setup step before each Node.js setup if missing
+    uses_pnpm = b"cache: 'pnpm'" in content or b'run: pnpm' in content
+    if uses_pnpm and b'pnpm/action-setup' not in content:
+        content, count = _PAT_SETUP_NODE.subn(_PNPM_SETUP, content)
+        if count:
+            changes.append(f"Added pnpm setup ({count} locations)")
+        else:
+            changes.append("⚠️  Could not find 'Setup Node' step to insert pnpm setup")
+
+    # 4. Update existing pnpm setup steps to @v2 and pnpm 10
+    count = content.count(b'pnpm/action-setup@v4')
+    if count:
+        content = content.replace(b'pnpm/action-setup@v4', b'pnpm/action-setup@v2')
+        changes.append(f"Updated action version v4 → v2 ({count} occurrences)")
+
+    content, count_v9 = _PAT_PNPM_V9.subn(rb'\1 ' + PNPM_VERSION, content)
+    content, count_v8 = _PAT_PNPM_V8.subn(rb'\1 ' + PNPM_VERSION, content)
+    count = count_v9 + count_v8
+    if count:
+        changes.append(f"Updated pnpm version → 10 ({count} occurrences)")
+
+    if content != original_content:
+        file_path.write_bytes(content)
+        return True, changes
+    return False, changes
+
+
+def main():
+    print("🔧 Fixing pnpm configuration in workflow files...\n")
+
+    if not WORKFLOWS_DIR.exists():
+        print(f"❌ Error: {WORKFLOWS_DIR} not found")
+        sys.exit(1)
+
+    workflow_files = sorted(list_workflow_files(WORKFLOWS_DIR))
+    print(f"Found {len(workflow_files)} workflow files\n")
+
+    modified = []
+    out = io.StringIO()
+    for file_path in workflow_files:
+        success, changes = fix_workflow_file(file_path)
+        if success:
+            print(f"✓ {file_path.name}", file=out)
+            modified.append(file_path.name)
+        else:
+            print(f"• {file_path.name} - no changes needed", file=out)
+        for change in changes:
+            print(f"  - {change}", file=out)
+
+    sys.stdout.write(out.getvalue())
+
+    print("━" * 70)
+    print(f"✅ Processed {len(workflow_files)} workflow files")
+    if modified:
+        print(f"📝 Modified {len(modified)} files")
+    else:
+        print("📝 No files needed modifications")
+    print("━" * 70)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,35 +3,49 @@
 Script to update pnpm version from 8 to 10 in all workflow files
 """
 
-import os
+import io
+import mmap
 import re
+import sys
 from pathlib import Path
 
-def find_workflow_files():
-    """Find all workflow files that use pnpm/action-setup"""
-    workflows_dir = Path('.github/workflows')
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'utils'))
+from workflow_files import list_workflow_files  # noqa: E402
+
+WORKFLOWS_DIR = Path('.github/workflows')
+
+# Pattern to find pnpm setup with version: 8
+_PAT_V8 = re.compile(rb'(uses: pnpm/action-setup@v2\s+with:\s+version:)\s*8')
+
+def find_workflow_files(workflow_files):
+    """Find the workflow files that use pnpm/action-setup"""
     files = []
-    for file in workflows_dir.glob('*.yml'):
-        content = file.read_text()
-        if 'pnpm/action-setup' in content:
-            files.append(file)
+    for file in workflow_files:
+        # Search the mapped file directly instead of reading it into memory
+        with open(file, 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if mm.find(b'pnpm/action-setup') != -1:
+                        files.append(file)
+            except ValueError:
+                # Empty files cannot be mapped
+                continue
     return files
 
 def update_pnpm_version(file_path):
     """Update pnpm version from 8 to 10"""
-    content = file_path.read_text()
-    original_content = content
+    content = file_path.read_bytes()
 
-    # Pattern to find pnpm setup with version: 8
-    pattern = r'(uses: pnpm/action-setup@v2\s+with:\s+version:)\s*8'
+    if b'pnpm/action-setup@v2' not in content:
+        return False, "No version 8 found (already updated or different version)"
+
+    original_content = content
 
     # Replace version 8 with version 10
-    new_content = re.sub(pattern, r'\1 10', content)
+    new_content, count = _PAT_V8.subn(rb'\1 10', content)
 
     if new_content != original_content:
-        file_path.write_text(new_content)
-        # Count occurrences
-        count = len(re.findall(pattern, content))
+        file_path.write_bytes(new_content)
         return True, f"Updated pnpm version 8 → 10 ({count} locations)"
     else:
         return False, "No version 8 found (already updated or different version)"
@@ -39,17 +53,20 @@ def update_pnpm_version(file_path):
 def main():
     print("🔧 Updating pnpm version in workflow files...\n")
 
-    workflow_files = find_workflow_files()
+    workflow_files = find_workflow_files(list_workflow_files(WORKFLOWS_DIR))
     print(f"Found {len(workflow_files)} workflow files using pnpm/action-setup\n")
 
     modified = []
+    out = io.StringIO()
     for file in workflow_files:
-        print(f"Processing: {file.name}")
+        print(f"Processing: {file.name}", file=out)
         success, message = update_pnpm_version(file)
-        print(f"  {'✓' if success else '•'} {message}")
+        print(f"  {'✓' if success else '•'} {message}", file=out)
         if success:
             modified.append(file.name)
 
+    sys.stdout.write(out.getvalue())
+
     print(f"\n✅ Processed {len(workflow_files)} workflow files")
     if modified:
         print(f"Modified {len(modified)} files:\n")
@@ -0,0 +1,16 @@
+"""
+Shared helpers for the GitHub Actions workflow fix scripts.
+"""
+
+import os
+from pathlib import Path
+
+
+def list_workflow_files(workflows_dir: Path) -> list[Path]:
+    """List the .yml files in the workflows directory."""
+    try:
+        with os.scandir(workflows_dir) as entries:
+            return [Path(entry.path) for entry in entries
+                    if entry.name.endswith('.yml') and entry.is_file()]
+    except FileNotFoundError:
+        return []